@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 from api.client import APIClient
+from _export.Export import export_panel
 from datetime import datetime, timedelta
 
 
@@ -100,4 +101,6 @@ def client_detail_page(customer_data):
                         del st.session_state.note_updated
                     
     else:
-        st.info("No booking history found")
\ No newline at end of file
+        st.info("No booking history found")
+
+    export_panel(api_client, key=f"client_export_{customer_data['id']}", customer_id=customer_data['id'])
\ No newline at end of file
@@ -3,13 +3,14 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
 from api.client import APIClient
+from _export.Export import export_panel
 
 def format_currency(amount):
     return f"${amount:,.2f}"
 
-def dashboard_page():
-    st.title("Dashboard")
-
+@st.fragment
+def insights_section():
+    """Filters, key metrics and bookings chart; reruns only on filter changes"""
     # ===== FILTERS ON MAIN PAGE =====
     st.subheader("Filters")
     
@@ -19,6 +20,7 @@ def dashboard_page():
         ["Week", "Month", "All Time", "Custom"],
         index=1,
         horizontal=True,
+        key="time_period",
     )
 
     # Define default end_date as today
@@ -36,9 +38,6 @@ def dashboard_page():
         else:  # All Time
             start_date = end_date - timedelta(days=365*5)  # 5 years back
 
-    # Slider for upcoming bookings
-    upcoming_hours = st.slider("Show upcoming bookings (hours)", 1, 3600, 24)
-
     # ===== DATA LOADING =====
     with st.spinner("Loading business insights..."):
         # Initialize API client
@@ -49,12 +48,11 @@ def dashboard_page():
             start_date=start_date.strftime("%Y-%m-%d"),
             end_date=end_date.strftime("%Y-%m-%d")
         )
-        upcoming = api_client.get_upcoming_bookings(hours=upcoming_hours)
         customers = api_client.get_customers()
 
     # ===== TOP METRICS =====
     st.header("Key Metrics")
-    col1, col2, col3, col4 = st.columns(4)
+    col1, col2, col3 = st.columns(3)
     
     with col1:
         st.metric("Total Clients", len(customers))
@@ -65,9 +63,6 @@ def dashboard_page():
     with col3:
         total_revenue = sum(b['amount'] for b in bookings) if bookings else 0
         st.metric("Total Revenue", format_currency(total_revenue))
-    
-    with col4:
-        st.metric("Upcoming", len(upcoming))
 
     # ===== BOOKINGS CHART =====
     st.header("Bookings Overview")
@@ -84,8 +79,19 @@ def dashboard_page():
     else:
         st.info("No bookings data available")
 
+
+@st.fragment
+def upcoming_section():
+    """Upcoming appointments; the hours slider only reruns this section"""
+    # Slider for upcoming bookings
+    upcoming_hours = st.slider("Show upcoming bookings (hours)", 1, 3600, 24, key="upcoming_hours")
+
+    api_client = APIClient.create_client(st.session_state.token)
+    upcoming = api_client.get_upcoming_bookings(hours=upcoming_hours)
+
     # ===== UPCOMING BOOKINGS =====
     st.header(f"Upcoming Appointments (Next {upcoming_hours} hours)")
+    st.metric("Upcoming", len(upcoming))
 
     if upcoming:
         # Fetch all services in one go
@@ -150,6 +156,23 @@ def dashboard_page():
     else:
         st.info("No upcoming appointments in the selected time frame")
 
+
+@st.fragment
+def export_section():
+    """Export panel; its widgets never rerun the rest of the dashboard"""
+    api_client = APIClient.create_client(st.session_state.token)
+    export_panel(api_client, key="dashboard_export")
+
+
+def dashboard_page():
+    st.title("Dashboard")
+
+    # Each section is a fragment: interacting with a section's widgets
+    # reruns only that section, the others are reused as rendered
+    insights_section()
+    upcoming_section()
+    export_section()
+
     # # ===== RECENT SERVICES =====
     # st.header("Recent Bookings Services")
     # if bookings:
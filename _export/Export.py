@@ -0,0 +1,159 @@
+# _export/Export.py
+import os
+import tempfile
+import time
+import streamlit as st
+from datetime import datetime, timedelta
+from api.client import APIClient, APIError
+from api.export import EXPORT_FORMATS, export_bookings, export_customers
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Exports live in their own temp directory so stale files can be swept safely
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), "salon_exports")
+EXPORT_MAX_AGE = 3600  # seconds an unclaimed export is kept on disk
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _sweep_stale_exports():
+    """Delete exports older than EXPORT_MAX_AGE, e.g. from closed sessions"""
+    cutoff = time.time() - EXPORT_MAX_AGE
+    for entry in os.scandir(EXPORT_DIR):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                _remove_file(entry.path)
+        except OSError:
+            pass
+
+
+def _discard_previous_export(key):
+    """Remove this panel's previous export file before a new one replaces it"""
+    previous = st.session_state.pop(key, None)
+    if previous:
+        _remove_file(previous["path"])
+
+
+def _read_and_remove(path):
+    """Build the download callable: read the file on click, then delete it"""
+    def read():
+        with open(path, "rb") as f:
+            data = f.read()
+        _remove_file(path)
+        return data
+    return read
+
+
+def export_panel(api_client: APIClient, key: str, customer_id=None):
+    """Export bookings (and, on the dashboard, customers) to CSV or Parquet
+
+    Data is streamed from the API page by page into a temporary file, so the
+    full dataset is never held in memory as Python objects.
+    """
+    with st.expander("📤 Export", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            dataset = "Bookings" if customer_id else st.radio(
+                "Dataset", ["Bookings", "Customers"], horizontal=True, key=f"{key}_dataset"
+            )
+        with col2:
+            fmt = st.radio("Format", EXPORT_FORMATS, horizontal=True, key=f"{key}_format")
+
+        filters = {}
+        if dataset == "Bookings":
+            today = datetime.today()
+            with col3:
+                start_date = st.date_input("Start Date", today - timedelta(days=365), key=f"{key}_start")
+                end_date = st.date_input("End Date", today, key=f"{key}_end")
+
+            services_dict = api_client.get_services()
+            selected_services = st.multiselect(
+                "Services",
+                options=list(services_dict),
+                format_func=lambda sid: services_dict.get(sid, str(sid)),
+                key=f"{key}_services"
+            )
+            try:
+                shop_names = api_client.get_shops()
+            except APIError as e:
+                logger.error(f"Error loading shops: {str(e)}")
+                shop_names = {}
+            shop = st.selectbox(
+                "Shop",
+                options=[None, *shop_names],
+                format_func=lambda sid: "All shops" if sid is None else f"{shop_names[sid]} (#{sid})",
+                key=f"{key}_shop"
+            )
+
+            if customer_id:
+                selected_customers = [customer_id]
+            else:
+                customers = st.session_state.get("customers", [])
+                names = {c["id"]: f"{c['first_name']} {c['last_name']}" for c in customers}
+                selected_customers = st.multiselect(
+                    "Customers",
+                    options=list(names),
+                    format_func=lambda cid: names.get(cid, str(cid)),
+                    key=f"{key}_customers"
+                )
+
+            filters = {
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d"),
+                "shop": shop,
+                "services": selected_services or None,
+                "customers": selected_customers or None,
+            }
+
+        if st.button("Export", key=f"{key}_run"):
+            progress = st.progress(0.0, text="Starting export...")
+
+            def on_progress(rows, fraction):
+                text = f"Exported {rows:,} rows..."
+                if fraction is None:
+                    progress.progress(0.5, text=text)
+                else:
+                    progress.progress(fraction, text=text)
+
+            suffix = ".csv" if fmt == "CSV" else ".parquet"
+            os.makedirs(EXPORT_DIR, exist_ok=True)
+            _sweep_stale_exports()
+            _discard_previous_export(key)
+            fd, path = tempfile.mkstemp(prefix=f"{dataset.lower()}_", suffix=suffix, dir=EXPORT_DIR)
+            os.close(fd)
+
+            try:
+                if dataset == "Bookings":
+                    rows = export_bookings(api_client, path, fmt, on_progress=on_progress, **filters)
+                else:
+                    rows = export_customers(api_client, path, fmt, on_progress=on_progress)
+            except Exception as e:
+                logger.error(f"Export failed: {str(e)}")
+                _remove_file(path)
+                progress.empty()
+                st.error(f"Export failed: {str(e)}")
+            else:
+                progress.progress(1.0, text=f"Exported {rows:,} rows")
+                st.session_state[key] = {
+                    "path": path,
+                    "name": f"{dataset.lower()}_{datetime.now():%Y%m%d_%H%M%S}{suffix}",
+                    "mime": "text/csv" if fmt == "CSV" else "application/octet-stream",
+                }
+
+        export_file = st.session_state.get(key)
+        if export_file and os.path.exists(export_file["path"]):
+            # A callable defers reading the file until the user clicks, so the
+            # export is not loaded into the media file manager on every rerun
+            st.download_button(
+                f"⬇️ Download {export_file['name']}",
+                data=_read_and_remove(export_file["path"]),
+                file_name=export_file["name"],
+                mime=export_file["mime"],
+                key=f"{key}_download"
+            )
@@ -0,0 +1,211 @@
+# _shops/Shops.py
+import streamlit as st
+import pandas as pd
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from api.client import APIClient, APIError
+from config.settings import Settings
+from _dashboard.Dashboard import format_currency
+
+MAX_FETCH_WORKERS = 8
+
+
+def shop_labels(shops: Dict[int, str]) -> Dict[int, str]:
+    """Display labels, suffixed with the ID where titles collide"""
+    titles = list(shops.values())
+    return {
+        shop_id: f"{title} #{shop_id}" if titles.count(title) > 1 else title
+        for shop_id, title in shops.items()
+    }
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_shop_bookings(_api_client: APIClient, shop_id: int, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+    """Bookings for one shop, cached per shop and date range
+
+    Goes through the raising iter_bookings, so a failed fetch is not cached
+    as an empty shop. The whole range is requested in one call since the
+    result is materialized anyway.
+    """
+    return [
+        booking
+        for page in _api_client.iter_bookings(start_date=start_date, end_date=end_date, shop=shop_id, per_page=-1)
+        for booking in page
+    ]
+
+
+def fetch_shop_bookings(
+    api_client: APIClient,
+    shop_ids: List[int],
+    start_date: str,
+    end_date: str
+) -> Tuple[Dict[int, List[Dict[str, Any]]], Dict[int, str]]:
+    """Fetch bookings for several shops concurrently
+
+    Shops already fetched for this range are cache hits, so only newly added
+    shops hit the API.
+
+    Returns:
+        Tuple (bookings by shop ID, error message by shop ID)
+    """
+    if not shop_ids:
+        return {}, {}
+
+    ctx = get_script_run_ctx()
+
+    def fetch(shop_id):
+        # Worker threads need the script context to use st.cache_data
+        add_script_run_ctx(threading.current_thread(), ctx)
+        try:
+            return shop_id, load_shop_bookings(api_client, shop_id, start_date, end_date), None
+        except APIError as e:
+            return shop_id, [], str(e)
+
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(shop_ids))) as executor:
+        results = list(executor.map(fetch, shop_ids))
+
+    bookings = {shop_id: items for shop_id, items, error in results if error is None}
+    errors = {shop_id: error for shop_id, _, error in results if error is not None}
+    return bookings, errors
+
+
+def _duration_hours(durations: pd.Series) -> pd.Series:
+    """Convert 'HH:MM' / 'HH:MM:SS' durations to fractional hours"""
+    durations = durations.fillna("").astype(str)
+    durations = durations.where(durations.str.count(":") != 1, durations + ":00")
+    return pd.to_timedelta(durations, errors="coerce").dt.total_seconds().fillna(0) / 3600
+
+
+def build_shop_frame(
+    shop_bookings: Dict[int, List[Dict[str, Any]]],
+    shop_names: Dict[int, str]
+) -> pd.DataFrame:
+    """Build one columnar frame of bookings across all selected shops"""
+    frames = [
+        pd.DataFrame({
+            "shop_id": shop_id,
+            "shop": shop_names.get(shop_id, str(shop_id)),
+            "booking_id": [b.get("id") for b in bookings],
+            "date": [b.get("date") for b in bookings],
+            "amount": [b.get("amount") for b in bookings],
+            "duration": [b.get("duration") for b in bookings],
+        })
+        for shop_id, bookings in shop_bookings.items()
+        if bookings
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["shop_id", "shop", "booking_id", "date", "amount", "hours"])
+
+    df = pd.concat(frames, ignore_index=True)
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    df["amount"] = pd.to_numeric(df["amount"], errors="coerce").fillna(0)
+    df["hours"] = _duration_hours(df.pop("duration"))
+    return df
+
+
+def aggregate_by_shop(df: pd.DataFrame, days: int) -> pd.DataFrame:
+    """Revenue, bookings and utilization per shop
+
+    Utilization is booked hours over the shop's open hours in the period.
+    """
+    summary = df.groupby("shop_id").agg(
+        shop=("shop", "first"),
+        bookings=("booking_id", "nunique"),
+        revenue=("amount", "sum"),
+        hours=("hours", "sum"),
+    )
+    summary["utilization"] = summary["hours"] / (max(days, 1) * Settings.SHOP_HOURS_PER_DAY)
+    return summary.sort_values("revenue", ascending=False)
+
+
+def shop_comparison_page():
+    st.title("Shop Comparison")
+
+    time_period = st.radio(
+        "Time Period",
+        ["Week", "Month", "Quarter", "Year", "Custom"],
+        index=1,
+        horizontal=True,
+    )
+
+    end_date = datetime.today()
+    if time_period == "Custom":
+        start_date = st.date_input("Start Date", end_date - timedelta(days=30))
+        end_date = st.date_input("End Date", end_date)
+    else:
+        days = {"Week": 7, "Month": 30, "Quarter": 90, "Year": 365}[time_period]
+        start_date = end_date - timedelta(days=days)
+
+    start = start_date.strftime("%Y-%m-%d")
+    end = end_date.strftime("%Y-%m-%d")
+    api_client = APIClient.create_client(st.session_state.token)
+
+    with st.spinner("Loading shops..."):
+        try:
+            shop_names = shop_labels(api_client.get_shops())
+        except APIError as e:
+            st.error(f"Error loading shops: {str(e)}")
+            return
+
+    if not shop_names:
+        st.info("No shops found")
+        return
+
+    selected = st.multiselect(
+        "Shops",
+        options=list(shop_names),
+        default=list(shop_names),
+        format_func=lambda sid: shop_names[sid],
+    )
+    if not selected:
+        st.info("Select at least one shop to compare")
+        return
+
+    with st.spinner("Loading shop data..."):
+        shop_bookings, errors = fetch_shop_bookings(api_client, selected, start, end)
+
+    for shop_id, error in errors.items():
+        st.warning(f"Could not load {shop_names[shop_id]}: {error}")
+
+    df = build_shop_frame(shop_bookings, shop_names)
+    if df.empty:
+        st.info("No bookings data available for the selected shops")
+        return
+
+    period_days = (end_date - start_date).days + 1
+    summary = aggregate_by_shop(df, period_days)
+
+    # ===== SIDE-BY-SIDE METRICS =====
+    st.header("Key Metrics by Shop")
+    for col, (_, row) in zip(st.columns(len(summary)), summary.iterrows()):
+        with col:
+            st.subheader(row["shop"])
+            st.metric("Bookings", int(row["bookings"]))
+            st.metric("Revenue", format_currency(row["revenue"]))
+            st.metric("Utilization", f"{row['utilization']:.0%}")
+
+    st.dataframe(
+        summary.set_index("shop"),
+        column_config={
+            "bookings": "Bookings",
+            "revenue": st.column_config.NumberColumn("Revenue", format="$%.2f"),
+            "hours": st.column_config.NumberColumn("Booked Hours", format="%.1f"),
+            "utilization": st.column_config.ProgressColumn("Utilization", min_value=0, max_value=1),
+        },
+        width="stretch"
+    )
+
+    # ===== CHARTS =====
+    st.header("Revenue Overview")
+    st.bar_chart(summary.set_index("shop")["revenue"])
+
+    daily_revenue = (
+        df.dropna(subset=["date"])
+        .pivot_table(index="date", columns="shop", values="amount", aggfunc="sum", fill_value=0)
+        .resample("D")
+        .sum()
+    )
+    st.line_chart(daily_revenue)
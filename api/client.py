@@ -2,7 +2,7 @@
 import streamlit as st
 import requests
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from config.settings import Settings
 import logging
 
@@ -266,7 +266,7 @@ class APIClient:
             return False, f"Health check failed: {str(e)}"
         
 
-    st.cache_data(ttl=3600, hash_funcs={"api.client.APIClient": lambda _: 0})
+    @st.cache_data(ttl=3600, hash_funcs={"api.client.APIClient": lambda _: 0})
     def get_services(_self) -> Dict[int, str]:
         """Get service ID to name mapping"""
         try:
@@ -286,6 +286,134 @@ class APIClient:
             logger.error(f"Error fetching services: {str(e)}")
             return {}
     
+    @st.cache_data(ttl=3600, show_spinner=False, hash_funcs={"api.client.APIClient": lambda _: 0})
+    def get_shops(_self) -> Dict[int, str]:
+        """Get shop ID to title mapping
+
+        Uses Settings.SHOPS when configured, otherwise the shops seen in one
+        bounded page of recent bookings. Raises APIError instead of returning
+        (and caching) an empty mapping when the request fails.
+
+        Returns:
+            Dict of shop ID to shop title
+        """
+        if Settings.SHOPS:
+            return dict(Settings.SHOPS)
+
+        today = datetime.now()
+        pages = _self.iter_bookings(
+            start_date=(today - timedelta(days=Settings.SHOP_DISCOVERY_DAYS)).strftime("%Y-%m-%d"),
+            end_date=today.strftime("%Y-%m-%d"),
+            order="desc",
+            per_page=Settings.SHOP_DISCOVERY_LIMIT
+        )
+        recent = next(pages, [])
+        pages.close()
+
+        shops = {}
+        for booking in recent:
+            shop = booking.get("shop") or {}
+            if shop.get("id"):
+                shops[int(shop["id"])] = shop.get("title") or f"Shop {shop['id']}"
+        return shops
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        per_page: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield successive pages of items from a paginated endpoint
+
+        Unlike the cached getters, errors are raised instead of swallowed so a
+        partial export is never mistaken for a complete one.
+        """
+        page = 1
+        while True:
+            try:
+                response = requests.get(
+                    f"{self.base_url}/{endpoint}",
+                    headers=self.headers,
+                    params={**params, "per_page": per_page, "page": page},
+                    timeout=30
+                )
+            except requests.RequestException as e:
+                logger.error(f"Network error: {str(e)}")
+                raise APIError(f"Network error: {str(e)}") from e
+
+            items = self._handle_response(response)
+            if items:
+                yield items
+            # per_page=-1 returns everything in a single response
+            if per_page < 0 or len(items) < per_page:
+                return
+            page += 1
+
+    def iter_bookings(
+        self,
+        start_date: str,
+        end_date: str,
+        shop: Optional[int] = None,
+        services: Optional[List[int]] = None,
+        customers: Optional[List[int]] = None,
+        orderby: str = "date_time",
+        order: str = "asc",
+        per_page: int = 100
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream bookings page by page (uncached)
+
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            shop: Shop ID filter
+            services: List of service IDs filter
+            customers: List of customer IDs filter
+            orderby: Order by field
+            order: Sort order (asc/desc)
+            per_page: Items per page
+
+        Yields:
+            Lists of booking dictionaries, one per page
+        """
+        params = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "orderby": orderby,
+            "order": order
+        }
+
+        if shop: params["shop"] = shop
+        if services: params["services"] = services
+        if customers: params["customers"] = customers
+
+        yield from self._iter_pages("bookings", params, per_page)
+
+    def iter_customers(
+        self,
+        search: str = "",
+        orderby: str = "first_name_last_name",
+        order: str = "asc",
+        per_page: int = 100
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream customers page by page (uncached)
+
+        Args:
+            search: Search string
+            orderby: Order by field
+            order: Sort order (asc/desc)
+            per_page: Items per page
+
+        Yields:
+            Lists of customer dictionaries, one per page
+        """
+        params = {
+            "search": search,
+            "orderby": orderby,
+            "order": order
+        }
+
+        yield from self._iter_pages("customers", params, per_page)
+
     def update_booking(self, booking_id: str, data: Dict[str, Any]) -> bool:
         """Update a booking
         
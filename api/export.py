@@ -0,0 +1,227 @@
+# api/export.py
+import csv
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from api.client import APIClient
+
+# Fixed column layouts so every page is written with the same header/schema
+BOOKING_COLUMNS = [
+    "booking_id",
+    "date",
+    "time",
+    "status",
+    "shop",
+    "customer_id",
+    "customer_first_name",
+    "customer_last_name",
+    "customer_email",
+    "customer_phone",
+    "duration",
+    "booking_amount",
+    "service_id",
+    "service_name",
+    "service_start_at",
+    "service_price",
+    "note",
+    "admin_note",
+]
+
+CUSTOMER_COLUMNS = [
+    "id",
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "address",
+    "note",
+]
+
+NUMERIC_COLUMNS = {"booking_amount", "service_price"}
+ID_COLUMNS = {"id", "booking_id", "customer_id", "service_id"}
+
+EXPORT_FORMATS = ["CSV", "Parquet"]
+
+ProgressCallback = Callable[[int, Optional[float]], None]
+
+
+def explode_booking(booking: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten a booking into one row per booked service
+
+    booking_amount is only set on the first service row, so summing it never
+    counts a multi-service booking twice; per-service revenue is service_price.
+    """
+    base = {
+        "booking_id": booking.get("id"),
+        "date": booking.get("date"),
+        "time": booking.get("time"),
+        "status": (booking.get("status") or "").replace("sln-b-", ""),
+        "shop": (booking.get("shop") or {}).get("title"),
+        "customer_id": booking.get("customer_id"),
+        "customer_first_name": booking.get("customer_first_name"),
+        "customer_last_name": booking.get("customer_last_name"),
+        "customer_email": booking.get("customer_email"),
+        "customer_phone": booking.get("customer_phone"),
+        "duration": booking.get("duration"),
+        "note": booking.get("note"),
+        "admin_note": booking.get("admin_note"),
+    }
+
+    services = booking.get("services") or [{}]
+    return [
+        {
+            **base,
+            "booking_amount": booking.get("amount") if i == 0 else None,
+            "service_id": service.get("service_id"),
+            "service_name": service.get("service_name"),
+            "service_start_at": service.get("start_at"),
+            "service_price": service.get("service_price"),
+        }
+        for i, service in enumerate(services)
+    ]
+
+
+def _booking_rows(
+    pages: Iterable[List[Dict[str, Any]]],
+    start_date: str,
+    end_date: str
+) -> Iterator[tuple]:
+    """Yield (rows, fraction_done) per page, estimating progress from booking dates"""
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    span = (datetime.strptime(end_date, "%Y-%m-%d") - start).days or 1
+
+    for page in pages:
+        rows = [row for booking in page for row in explode_booking(booking)]
+        try:
+            last = datetime.strptime(page[-1]["date"], "%Y-%m-%d")
+            fraction = min(max((last - start).days / span, 0.0), 1.0)
+        except (KeyError, TypeError, ValueError):
+            fraction = None
+        yield rows, fraction
+
+
+def _customer_rows(pages: Iterable[List[Dict[str, Any]]]) -> Iterator[tuple]:
+    """Yield (rows, fraction_done) per page; the total is unknown up front"""
+    for page in pages:
+        yield [{col: customer.get(col) for col in CUSTOMER_COLUMNS} for customer in page], None
+
+
+def _to_number(value: Any, cast: Callable[[Any], Any]) -> Any:
+    """Cast a value for a typed Parquet column; malformed values become null"""
+    if value is None or value == "":
+        return None
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _write_csv(chunks: Iterable[tuple], columns: List[str], path: str, on_progress: Optional[ProgressCallback]) -> int:
+    written = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for rows, fraction in chunks:
+            writer.writerows(rows)
+            written += len(rows)
+            if on_progress:
+                on_progress(written, fraction)
+    return written
+
+
+def _write_parquet(chunks: Iterable[tuple], columns: List[str], path: str, on_progress: Optional[ProgressCallback]) -> int:
+    # pyarrow ships with streamlit, but keep the import local to the parquet path
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def column_type(col):
+        if col in ID_COLUMNS:
+            return pa.int64()
+        if col in NUMERIC_COLUMNS:
+            return pa.float64()
+        return pa.string()
+
+    schema = pa.schema([(col, column_type(col)) for col in columns])
+
+    def to_column(rows, col):
+        if col in ID_COLUMNS:
+            return [_to_number(r.get(col), int) for r in rows]
+        if col in NUMERIC_COLUMNS:
+            return [_to_number(r.get(col), float) for r in rows]
+        return [str(r[col]) if r.get(col) is not None else None for r in rows]
+
+    written = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows, fraction in chunks:
+            if rows:
+                # One row group per API page keeps memory bounded by the page size
+                writer.write_table(pa.table({col: to_column(rows, col) for col in columns}, schema=schema))
+            written += len(rows)
+            if on_progress:
+                on_progress(written, fraction)
+    return written
+
+
+def _write(chunks: Iterable[tuple], columns: List[str], path: str, fmt: str, on_progress: Optional[ProgressCallback]) -> int:
+    if fmt == "CSV":
+        return _write_csv(chunks, columns, path, on_progress)
+    if fmt == "Parquet":
+        return _write_parquet(chunks, columns, path, on_progress)
+    raise ValueError(f"Unsupported export format: {fmt}")
+
+
+def export_bookings(
+    api_client: APIClient,
+    path: str,
+    fmt: str,
+    start_date: str,
+    end_date: str,
+    shop: Optional[int] = None,
+    services: Optional[List[int]] = None,
+    customers: Optional[List[int]] = None,
+    on_progress: Optional[ProgressCallback] = None
+) -> int:
+    """Stream bookings (one row per service) to a CSV or Parquet file
+
+    Args:
+        api_client: Authenticated API client
+        path: Destination file path
+        fmt: Export format (CSV or Parquet)
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        shop: Shop ID filter
+        services: List of service IDs filter
+        customers: List of customer IDs filter
+        on_progress: Called with (rows written, fraction done or None) after each page
+
+    Returns:
+        Number of rows written
+    """
+    pages = api_client.iter_bookings(
+        start_date=start_date,
+        end_date=end_date,
+        shop=shop,
+        services=services,
+        customers=customers
+    )
+    return _write(_booking_rows(pages, start_date, end_date), BOOKING_COLUMNS, path, fmt, on_progress)
+
+
+def export_customers(
+    api_client: APIClient,
+    path: str,
+    fmt: str,
+    on_progress: Optional[ProgressCallback] = None
+) -> int:
+    """Stream all customers to a CSV or Parquet file
+
+    Args:
+        api_client: Authenticated API client
+        path: Destination file path
+        fmt: Export format (CSV or Parquet)
+        on_progress: Called with (rows written, None) after each page
+
+    Returns:
+        Number of rows written
+    """
+    return _write(_customer_rows(api_client.iter_customers()), CUSTOMER_COLUMNS, path, fmt, on_progress)
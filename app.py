@@ -4,6 +4,7 @@ from config.session import SessionManager
 from _login.Login import login_page
 from _dashboard.Dashboard import dashboard_page
 from _clients.Clients import client_detail_page
+from _shops.Shops import shop_comparison_page
 from api.client import APIClient
 
 def create_client_page_function(customer_data):
@@ -26,6 +27,7 @@ def main():
     login_Page = st.Page(login_page, title="Log in", icon=":material/login:")
     logout_Page = st.Page(SessionManager.clear_session, title="Log out", icon=":material/logout:")
     dashboard = st.Page(dashboard_page, title="Dashboard", icon=":material/dashboard:", default=True)
+    shops = st.Page(shop_comparison_page, title="Shop Comparison", icon=":material/store:")
     
     # Dynamically create client detail pages
     client_pages = []
@@ -54,7 +56,7 @@ def main():
         pg = st.navigation(
             {
                 "Account": [logout_Page],
-                "Dashboard": [dashboard],
+                "Dashboard": [dashboard, shops],
                 "Clients": client_pages
             }
         )
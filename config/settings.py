@@ -4,4 +4,8 @@ class Settings:
     CUSTOMERS_URL = 'https://skinbylauralo.com/wp-json/salon/api/v1/customers'
     PAGE_TITLE = "Lalo's Salon Dashboard"
     PAGE_ICON = ":material/face:"
-    API_BASE_URL = "https://skinbylauralo.com/wp-json/salon/api/v1"
\ No newline at end of file
+    API_BASE_URL = "https://skinbylauralo.com/wp-json/salon/api/v1"
+    SHOP_HOURS_PER_DAY = 8  # open hours per shop per day, used for utilization
+    SHOPS = {}  # shop ID -> title; when empty, shops are discovered from recent bookings
+    SHOP_DISCOVERY_LIMIT = 200  # recent bookings sampled to discover shops
+    SHOP_DISCOVERY_DAYS = 90  # how far back that sample reaches
\ No newline at end of file
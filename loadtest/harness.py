@@ -0,0 +1,337 @@
+# loadtest/harness.py
+"""Multi-session load test for the dashboard and client pages
+
+Starts the mock Salon API in a subprocess, points APIClient at it and drives
+N simulated logged-in sessions of app.py with Streamlit's AppTest, so every
+rerun includes main(): customer loading, page construction and st.navigation.
+Each session loads the dashboard, moves the upcoming-hours slider, toggles
+the time period and switches to a client page. All sessions share this
+process's st.cache_data / st.cache_resource caches, as staff sessions do in
+the real Streamlit server, so upstream request counts reflect the
+shared-cache behavior of APIClient.
+
+Usage (from the repository root):
+
+    python -m loadtest.harness --sessions 8 --iterations 5 --latency 0.05
+
+Notes:
+    - This is a SEQUENTIAL measurement. AppTest.run swaps process-global
+      state (Runtime._instance, PagesManager), so runs from different
+      sessions are serialized behind a lock. Sessions still interleave
+      their steps, so cache sharing and request amplification are
+      realistic. Latencies are single-rerun times without contention,
+      not latencies under concurrent load.
+    - AppTest reruns the whole script on every interaction, so fragment-scoped
+      reruns are measured as full reruns; latencies are an upper bound.
+    - CPU and memory are process-wide (the mock API runs in its own process)
+      and divided by the number of sessions.
+    - Exceptions raised in AppTest's script-runner threads are caught with
+      threading.excepthook and reported under "script_thread".
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List
+
+import requests
+
+from loadtest.mock_api import API_PREFIX
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+DASHBOARD = "dashboard"
+UPCOMING_SLIDER = "upcoming_slider"
+TIME_PERIOD = "time_period"
+CLIENT_PAGE = "client_page"
+
+SLIDER_VALUES = [24, 48, 168, 720]
+TIME_PERIODS = ["Week", "Month", "All Time"]
+
+# AppTest.run mutates process-global Streamlit state, so runs are serialized
+_APPTEST_LOCK = threading.Lock()
+
+SCRIPT_THREAD = "script_thread"
+
+# AppTest sessions driven from harness threads make Streamlit warn on every
+# rerun about the missing ScriptRunContext / runtime; keep the report readable
+QUIET_LOGGERS = [
+    "streamlit.runtime.scriptrunner_utils",
+    "streamlit.runtime.scriptrunner_utils.script_run_context",
+    "streamlit.runtime.caching.cache_data_api",
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _rss_mb() -> float:
+    """Current resident set size, falling back to peak RSS off Linux"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def start_mock_api(port: int, latency: float, customers: int, bookings: int) -> subprocess.Popen:
+    """Start the mock API subprocess and wait until it answers"""
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "loadtest.mock_api",
+            "--port", str(port),
+            "--latency", str(latency),
+            "--customers", str(customers),
+            "--bookings", str(bookings),
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"http://127.0.0.1:{port}/__stats__", timeout=1)
+            return process
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Mock Salon API did not start")
+
+
+def _switch_page(app, url_path: str):
+    """Switch an AppTest to an st.navigation page by its url_path
+
+    AppTest.switch_page only accepts file-based pages, while app.py registers
+    callables, so look the page up in the registry from the previous run.
+    """
+    for page_hash, info in app._registered_pages.items():
+        if info.get("url_pathname") == url_path:
+            app._page_hash = page_hash
+            return app
+    raise ValueError(f"No navigation page registered for url_path {url_path!r}")
+
+
+class Session:
+    """One simulated logged-in staff session of app.py"""
+
+    def __init__(self, index: int, customers: List[Dict[str, Any]], timeout: float):
+        from streamlit.testing.v1 import AppTest
+
+        self.index = index
+        self.rng = random.Random(index)
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(Counter)
+        self.client_path = f"client_{self.rng.choice(customers)['id']}"
+
+        self.app = AppTest.from_file(APP_SCRIPT, default_timeout=timeout)
+        self.app.session_state["token"] = f"loadtest-token-{index}"
+        self.app.session_state["logged_in"] = True
+
+    def _timed(self, action: str, run):
+        with _APPTEST_LOCK:
+            start = time.perf_counter()
+            try:
+                app = run()
+                for exc in app.exception:
+                    self.errors[action][exc.value] += 1
+            except Exception as e:
+                self.errors[action][f"{type(e).__name__}: {e}"] += 1
+            self.latencies[action].append(time.perf_counter() - start)
+
+    def run(self, iterations: int):
+        app = self.app
+        for _ in range(iterations):
+            self._timed(DASHBOARD, lambda: _switch_page(app, "").run() if app._registered_pages else app.run())
+            self._timed(
+                UPCOMING_SLIDER,
+                lambda: app.slider(key="upcoming_hours").set_value(self.rng.choice(SLIDER_VALUES)).run()
+            )
+            self._timed(
+                TIME_PERIOD,
+                lambda: app.radio(key="time_period").set_value(self.rng.choice(TIME_PERIODS)).run()
+            )
+            self._timed(CLIENT_PAGE, lambda: _switch_page(app, self.client_path).run())
+
+
+def run_load_test(
+    sessions: int,
+    iterations: int,
+    latency: float,
+    customers: int,
+    bookings: int,
+    timeout: float
+) -> Dict[str, Any]:
+    """Run the load test and return a summary report"""
+    import streamlit as st
+    from config.settings import Settings
+
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.ERROR)
+
+    port = _free_port()
+    mock = start_mock_api(port, latency, customers, bookings)
+    control_url = f"http://127.0.0.1:{port}"
+
+    try:
+        Settings.API_BASE_URL = f"{control_url}{API_PREFIX}"
+        st.cache_data.clear()
+        st.cache_resource.clear()
+
+        customer_list = requests.get(
+            f"{Settings.API_BASE_URL}/customers", params={"per_page": -1}, timeout=10
+        ).json()["items"]
+        requests.get(f"{control_url}/__reset__", timeout=5)
+
+        workers = [Session(i, customer_list, timeout) for i in range(sessions)]
+        threads = [threading.Thread(target=w.run, args=(iterations,)) for w in workers]
+
+        # Failures in AppTest's script-runner threads never reach the session
+        thread_errors = Counter()
+        thread_errors_lock = threading.Lock()
+        previous_excepthook = threading.excepthook
+
+        def record_thread_error(args):
+            with thread_errors_lock:
+                thread_errors[f"{args.exc_type.__name__}: {args.exc_value}"] += 1
+
+        threading.excepthook = record_thread_error
+
+        rss_before = _rss_mb()
+        cpu_before = time.process_time()
+        wall_start = time.perf_counter()
+        for t in threads:
+            t.start()
+        try:
+            for t in threads:
+                t.join()
+        finally:
+            threading.excepthook = previous_excepthook
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_before
+        rss_after = _rss_mb()
+
+        upstream = requests.get(f"{control_url}/__stats__", timeout=5).json()
+    finally:
+        mock.terminate()
+        mock.wait()
+
+    latencies = defaultdict(list)
+    for w in workers:
+        for action, values in w.latencies.items():
+            latencies[action].extend(values)
+    reruns = sum(len(v) for v in latencies.values())
+    upstream_total = sum(upstream.values())
+
+    errors = _merge_errors(workers)
+    if thread_errors:
+        errors[SCRIPT_THREAD] = dict(thread_errors)
+
+    return {
+        "mode": "sequential",
+        "sessions": sessions,
+        "iterations": iterations,
+        "reruns": reruns,
+        "errors": errors,
+        "wall_seconds": wall,
+        "latency_ms": {
+            action: {
+                "p50": _percentile(values, 50) * 1000,
+                "p90": _percentile(values, 90) * 1000,
+                "p99": _percentile(values, 99) * 1000,
+                "max": max(values) * 1000,
+            }
+            for action, values in latencies.items()
+        },
+        "upstream_requests": upstream,
+        "upstream_per_rerun": upstream_total / reruns if reruns else 0.0,
+        "cpu_seconds_per_session": cpu / sessions,
+        "rss_mb": {
+            "before": rss_before,
+            "after": rss_after,
+            "per_session": (rss_after - rss_before) / sessions,
+            "peak": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        },
+    }
+
+
+def _merge_errors(workers: List[Session]) -> Dict[str, Dict[str, int]]:
+    errors = defaultdict(Counter)
+    for w in workers:
+        for action, messages in w.errors.items():
+            errors[action].update(messages)
+    return {action: dict(messages) for action, messages in errors.items()}
+
+
+def print_report(report: Dict[str, Any]):
+    error_count = sum(sum(messages.values()) for messages in report["errors"].values())
+    print(f"\nMode: {report['mode']} (AppTest runs are serialized; latencies exclude contention)")
+    print(f"Sessions: {report['sessions']}  Iterations: {report['iterations']}  "
+          f"Reruns: {report['reruns']}  Errors: {error_count}  "
+          f"Wall: {report['wall_seconds']:.1f}s")
+
+    if report["errors"]:
+        print("\nErrors")
+        for action, messages in report["errors"].items():
+            for message, count in messages.items():
+                print(f"  {action:<18}{count:>5}x  {message.splitlines()[0] if message else ''}")
+
+    print("\nRerun latency (ms)")
+    print(f"  {'action':<18}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+    for action, stats in report["latency_ms"].items():
+        print(f"  {action:<18}{stats['p50']:>10.1f}{stats['p90']:>10.1f}{stats['p99']:>10.1f}{stats['max']:>10.1f}")
+
+    print("\nUpstream requests")
+    for endpoint, count in sorted(report["upstream_requests"].items()):
+        print(f"  {endpoint:<28}{count:>8}")
+    print(f"  {'per rerun':<28}{report['upstream_per_rerun']:>8.2f}")
+
+    rss = report["rss_mb"]
+    print(f"\nCPU per session: {report['cpu_seconds_per_session']:.2f}s")
+    print(f"RSS: {rss['before']:.0f} MB -> {rss['after']:.0f} MB "
+          f"({rss['per_session']:.1f} MB/session, peak {rss['peak']:.0f} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the dashboard with multiple interleaved sessions")
+    parser.add_argument("--sessions", type=int, default=8, help="Number of simulated sessions")
+    parser.add_argument("--iterations", type=int, default=5, help="Navigation loops per session")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated upstream latency (seconds)")
+    parser.add_argument("--customers", type=int, default=200, help="Customers in the mock dataset")
+    parser.add_argument("--bookings", type=int, default=5000, help="Bookings in the mock dataset")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-rerun timeout (seconds)")
+    parser.add_argument("--json", help="Also write the report to this JSON file")
+    args = parser.parse_args()
+
+    report = run_load_test(
+        sessions=args.sessions,
+        iterations=args.iterations,
+        latency=args.latency,
+        customers=args.customers,
+        bookings=args.bookings,
+        timeout=args.timeout
+    )
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
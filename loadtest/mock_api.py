@@ -0,0 +1,239 @@
+# loadtest/mock_api.py
+"""Local mock of the Salon Booking API used by the load-testing harness
+
+Serves deterministic fake customers, services and bookings on the endpoints
+APIClient uses, and counts every request so the harness can measure upstream
+request amplification. Run standalone with:
+
+    python -m loadtest.mock_api --port 8765
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/wp-json/salon/api/v1"
+
+SHOPS = [{"id": 1, "title": "Downtown"}, {"id": 2, "title": "Uptown"}, {"id": 3, "title": "Harbor"}]
+SERVICE_NAMES = [
+    "Facial", "Peel", "Microneedling", "Dermaplaning", "Brow Lamination",
+    "Lash Lift", "Waxing", "LED Therapy", "Hydrafacial", "Consultation",
+]
+STATUSES = ["sln-b-confirmed", "sln-b-paid", "sln-b-pending", "sln-b-canceled"]
+
+
+def generate_dataset(customers: int = 200, bookings: int = 5000, seed: int = 42) -> Dict[str, List[Dict[str, Any]]]:
+    """Build a deterministic dataset spanning two years back and a month ahead"""
+    rng = random.Random(seed)
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+
+    services = [{"id": i + 1, "name": name, "price": float(rng.randrange(50, 400, 5))}
+                for i, name in enumerate(SERVICE_NAMES)]
+
+    customer_items = [
+        {
+            "id": i + 1,
+            "first_name": f"First{i + 1}",
+            "last_name": f"Last{i + 1}",
+            "email": f"customer{i + 1}@example.com",
+            "phone": f"555-{i + 1:04d}",
+            "address": f"{i + 1} Main St",
+            "note": "",
+        }
+        for i in range(customers)
+    ]
+
+    booking_items = []
+    for i in range(bookings):
+        customer = rng.choice(customer_items)
+        start = now + timedelta(hours=rng.randint(-24 * 730, 24 * 30))
+        booked = rng.sample(services, rng.randint(1, 2))
+        booking_items.append({
+            "id": i + 1,
+            "date": start.strftime("%Y-%m-%d"),
+            "time": start.strftime("%H:%M"),
+            "status": rng.choice(STATUSES),
+            "amount": sum(s["price"] for s in booked),
+            "duration": f"{len(booked):02d}:00",
+            "customer_id": customer["id"],
+            "customer_first_name": customer["first_name"],
+            "customer_last_name": customer["last_name"],
+            "customer_email": customer["email"],
+            "customer_phone": customer["phone"],
+            "customer_address": customer["address"],
+            "shop": rng.choice(SHOPS),
+            "services": [
+                {
+                    "service_id": s["id"],
+                    "service_name": s["name"],
+                    "service_price": s["price"],
+                    "start_at": start.strftime("%H:%M"),
+                }
+                for s in booked
+            ],
+            "note": "",
+            "admin_note": "",
+        })
+    booking_items.sort(key=lambda b: (b["date"], b["time"]))
+
+    return {"customers": customer_items, "services": services, "bookings": booking_items}
+
+
+def _paginate(items: List[Dict[str, Any]], query: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    per_page = int(query.get("per_page", ["-1"])[0])
+    page = int(query.get("page", ["1"])[0])
+    if per_page < 0:
+        return items
+    return items[(page - 1) * per_page:page * per_page]
+
+
+class MockSalonAPI(ThreadingHTTPServer):
+    """Threaded HTTP server holding the dataset and request counters"""
+
+    daemon_threads = True
+
+    def __init__(self, address, dataset: Dict[str, List[Dict[str, Any]]], latency: float = 0.0):
+        super().__init__(address, _Handler)
+        self.dataset = dataset
+        self.latency = latency
+        self.counts = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def record(self, endpoint: str):
+        with self._lock:
+            self.counts[endpoint] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+    def reset(self):
+        with self._lock:
+            self.counts.clear()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: MockSalonAPI
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: Any):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        # Control endpoints for the harness; not counted as upstream traffic
+        if url.path == "/__stats__":
+            return self._send(200, self.server.stats())
+        if url.path == "/__reset__":
+            self.server.reset()
+            return self._send(200, {})
+
+        if not url.path.startswith(API_PREFIX):
+            return self._send(404, {"message": "Not found"})
+        endpoint = url.path[len(API_PREFIX):]
+        self.server.record(f"GET {endpoint}")
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        data = self.server.dataset
+        if endpoint == "/health":
+            return self._send(200, {"status": "ok"})
+        if endpoint == "/customers":
+            return self._send(200, {"items": _paginate(data["customers"], query)})
+        if endpoint == "/services":
+            return self._send(200, {"items": _paginate(data["services"], query)})
+        if endpoint == "/bookings":
+            return self._send(200, {"items": _paginate(self._filter_bookings(query), query)})
+        if endpoint == "/bookings/upcoming":
+            return self._send(200, {"items": self._upcoming(int(query.get("hours", ["24"])[0]))})
+        if endpoint == "/bookings/stats":
+            return self._send(200, {"items": self._stats(self._filter_bookings(query))})
+        return self._send(404, {"message": "Not found"})
+
+    def do_PUT(self):
+        url = urlparse(self.path)
+        self.server.record("PUT /bookings/{id}")
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if url.path.startswith(f"{API_PREFIX}/bookings/"):
+            return self._send(200, {"status": "updated"})
+        return self._send(404, {"message": "Not found"})
+
+    def _filter_bookings(self, query: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        start = query.get("start_date", ["0000-00-00"])[0]
+        end = query.get("end_date", ["9999-99-99"])[0]
+        shop = int(query["shop"][0]) if "shop" in query else None
+        customers = {int(c) for c in query.get("customers", [])}
+        services = {int(s) for s in query.get("services", [])}
+
+        items = [
+            b for b in self.server.dataset["bookings"]
+            if start <= b["date"] <= end
+            and (shop is None or b["shop"]["id"] == shop)
+            and (not customers or b["customer_id"] in customers)
+            and (not services or any(s["service_id"] in services for s in b["services"]))
+        ]
+        if query.get("order", ["desc"])[0] == "desc":
+            items.reverse()
+        return items
+
+    def _upcoming(self, hours: int) -> List[Dict[str, Any]]:
+        now = datetime.now()
+        until = now + timedelta(hours=hours)
+        return [
+            b for b in self.server.dataset["bookings"]
+            if now <= datetime.strptime(f"{b['date']} {b['time']}", "%Y-%m-%d %H:%M") <= until
+        ]
+
+    def _stats(self, bookings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        grouped = {}
+        for b in bookings:
+            entry = grouped.setdefault(b["date"][:7], {"period": b["date"][:7], "count": 0, "amount": 0.0})
+            entry["count"] += 1
+            entry["amount"] += b["amount"]
+        return sorted(grouped.values(), key=lambda e: e["period"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local mock of the Salon Booking API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of simulated upstream latency per request")
+    parser.add_argument("--customers", type=int, default=200)
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    server = MockSalonAPI(
+        (args.host, args.port),
+        generate_dataset(args.customers, args.bookings, args.seed),
+        args.latency
+    )
+    print(f"Mock Salon API listening on {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()